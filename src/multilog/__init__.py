@@ -15,6 +15,7 @@ Example usage (asynchronous):
 """
 
 from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING
 
 from multilog.async_logger import AsyncLogger
 from multilog.exceptions import ConfigError, MultilogError, SinkError
@@ -22,11 +23,13 @@ from multilog.levels import LogLevel
 from multilog.logger import Logger
 from multilog.sinks import (
     BaseSink,
-    BetterstackSink,
     ConsoleSink,
     FileSink,
 )
 
+if TYPE_CHECKING:
+    from multilog.sinks import BetterstackSink
+
 try:
     __version__ = version("multilog")
 except PackageNotFoundError:
@@ -44,3 +47,14 @@ __all__ = [
     "MultilogError",
     "SinkError",
 ]
+
+
+def __getattr__(name: str):
+    # Forward the lazy BetterstackSink export (see multilog.sinks) so
+    # 'import multilog' alone never imports httpx.
+    if name == "BetterstackSink":
+        from multilog.sinks import BetterstackSink
+
+        globals()[name] = BetterstackSink
+        return BetterstackSink
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
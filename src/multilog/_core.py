@@ -1,17 +1,61 @@
 """Shared synchronous core logic for multilog-py loggers."""
 
 import os
+import queue
 import sys
+import threading
+import time
 import traceback as tb
-from datetime import UTC, datetime
 from typing import Any
 
 from multilog.exceptions import ConfigError
 from multilog.levels import LogLevel
 from multilog.sinks.base import BaseSink
-from multilog.sinks.betterstack import BetterstackSink
 from multilog.sinks.console import ConsoleSink
 
+# Sentinel pushed onto the dispatch queue to stop the worker thread.
+_STOP = object()
+
+# Batching knobs for the worker drain (see _LoggerCore.__init__).
+_MAX_BATCH = 512
+_MAX_LINGER_MS = 50
+
+# Cloned per log_endpoint call so the constant keys are not re-hashed
+# into a fresh dict literal per request.
+_ENDPOINT_EVENT_TEMPLATE: dict[str, Any] = {
+    "event_source": "http_endpoint",
+    "event_type": "endpoint_invocation",
+    "endpoint_name": "",
+    "request": None,
+}
+
+
+class _RateLimitedWarner:
+    """
+    Writes at most one warning per key per interval to stderr.
+
+    Keeps a flapping sink (e.g. a bad Betterstack token) from turning
+    every dispatched record into an extra stderr write; suppressed
+    repeats are counted and noted on the next emitted line.
+    """
+
+    def __init__(self, interval: float = 5.0):
+        self.interval = interval
+        self._last: dict[str, float] = {}
+        self._suppressed: dict[str, int] = {}
+
+    def warn(self, key: str, message: str) -> None:
+        """Write message to stderr unless key warned within interval."""
+        now = time.monotonic()
+        if now - self._last.get(key, 0.0) < self.interval:
+            self._suppressed[key] = self._suppressed.get(key, 0) + 1
+            return
+        suppressed = self._suppressed.pop(key, 0)
+        if suppressed:
+            message += f" ({suppressed} similar suppressed)"
+        self._last[key] = now
+        sys.stderr.write(message + "\n")
+
 
 class _LoggerCore:
     """
@@ -19,15 +63,82 @@ class _LoggerCore:
 
     Both the synchronous Logger and AsyncLogger delegate to this class
     for payload construction and sink dispatch.
+
+    When ``async_sinks`` is True, log calls only enqueue the payload and a
+    daemon worker thread delivers it to the sinks, so the caller never
+    waits on sink I/O (file writes, HTTP requests, etc.).
     """
 
+    __slots__ = (
+        "sinks",
+        "default_context",
+        "include_caller",
+        "max_batch",
+        "max_linger_ms",
+        "_warner",
+        "_queue",
+        "_worker",
+        "_solo",
+        "_enabled_mask",
+        "_sink_table",
+        "_table_by_rank",
+    )
+
     def __init__(
         self,
         sinks: list[BaseSink] | None = None,
         default_context: dict[str, Any] | None = None,
+        async_sinks: bool = False,
+        max_batch: int = _MAX_BATCH,
+        max_linger_ms: int = _MAX_LINGER_MS,
+        include_caller: bool = False,
     ):
         self.sinks = sinks if sinks is not None else _default_sinks()
         self.default_context = default_context or {}
+        self.include_caller = include_caller
+        self._warner = _RateLimitedWarner()
+        # Union of the sink level masks: _level_enabled is one int AND.
+        self._enabled_mask = 0
+        for sink in self.sinks:
+            self._enabled_mask |= sink._level_mask
+        # Per-sink dispatch table bound once: (level mask, single-record
+        # emit, batch emit, class name). Binding emit here skips the
+        # attribute lookups per batch, and sinks without a default
+        # context get their _emit directly since BaseSink.emit would
+        # only forward to it.
+        self._sink_table = tuple(
+            (
+                sink._level_mask,
+                sink.emit if sink.default_context else sink._emit,
+                sink.emit_many,
+                sink.__class__.__name__,
+            )
+            for sink in self.sinks
+        )
+        # The same table pre-filtered per level rank, so single-record
+        # dispatch touches only the sinks that accept the level with no
+        # per-call mask checks. Sink filters are fixed after __init__,
+        # so the tables never need invalidation.
+        self._table_by_rank = tuple(
+            tuple(entry for entry in self._sink_table if entry[0] & (1 << rank))
+            for rank in range(len(LogLevel))
+        )
+        self.max_batch = max_batch
+        self.max_linger_ms = max_linger_ms
+        self._queue: queue.SimpleQueue | None = None
+        self._worker: threading.Thread | None = None
+        if async_sinks:
+            self._queue = queue.SimpleQueue()
+            self._worker = threading.Thread(target=self._drain, daemon=True)
+            self._worker.start()
+        # Fast path for the common single-sink inline setup: log() can
+        # skip the any() prefilter, the dispatch indirection, and the
+        # per-batch list allocations.
+        self._solo = (
+            self.sinks[0]
+            if self._queue is None and not include_caller and len(self.sinks) == 1
+            else None
+        )
 
     def _build_payload(
         self,
@@ -36,13 +147,16 @@ class _LoggerCore:
         content: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Build the log payload dictionary."""
-        return {
-            "timestamp_ms": int(datetime.now(UTC).timestamp() * 1000),
+        payload = {
+            "timestamp_ms": time.time_ns() // 1_000_000,
             "message": message,
             "level": level.value,
-            **self.default_context,
-            **(content or {}),
         }
+        if self.default_context:
+            payload.update(self.default_context)
+        if content:
+            payload.update(content)
+        return payload
 
     def log(
         self,
@@ -58,21 +172,93 @@ class _LoggerCore:
             level: Log level
             content: Additional metadata to include
         """
+        solo = self._solo
+        if solo is not None:
+            if not solo._should_log(level):
+                return
+            payload = self._build_payload(message, level, content)
+            try:
+                solo.emit(payload)
+            except Exception as exc:
+                name = solo.__class__.__name__
+                self._warner.warn(name, f"Sink {name} failed: {exc}")
+            return
+        if not self._level_enabled(level):
+            return
         payload = self._build_payload(message, level, content)
-        self._dispatch(payload)
+        if self.include_caller:
+            payload["caller"] = _caller_info()
+        self._dispatch(payload, level)
 
-    def _dispatch(self, payload: dict[str, Any]) -> None:
-        """Dispatch payload to all sinks sequentially with error handling."""
-        for sink in self.sinks:
+    def _level_enabled(self, level: LogLevel) -> bool:
+        """Check whether at least one sink accepts this level.
+
+        Called before payload construction so records no sink wants cost
+        only one int AND (no dict merge, no timestamp read).
+        """
+        return bool(self._enabled_mask & (1 << level.rank))
+
+    def _dispatch(self, payload: dict[str, Any], level: LogLevel) -> None:
+        """Enqueue payload for the worker thread, or deliver inline."""
+        if self._queue is not None:
+            self._queue.put((payload, level))
+            return
+        for _mask, emit, _emit_many, name in self._table_by_rank[level.rank]:
+            try:
+                emit(payload)
+            except Exception as exc:
+                self._warner.warn(name, f"Sink {name} failed: {exc}")
+
+    def _drain(self) -> None:
+        """
+        Worker loop: deliver queued payloads until the stop sentinel.
+
+        Payloads are coalesced into batches (bounded by max_batch, with a
+        short linger window to collect stragglers) so sinks that support
+        batched emission can amortize per-call overhead, e.g. one HTTP
+        request per batch instead of per record.
+        """
+        assert self._queue is not None
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self.max_linger_ms / 1000
+            while len(batch) < self.max_batch:
+                timeout = deadline - time.monotonic()
+                try:
+                    item = (
+                        self._queue.get_nowait()
+                        if timeout <= 0
+                        else self._queue.get(timeout=timeout)
+                    )
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            self._dispatch_now(batch)
+            if stop:
+                return
+
+    def _dispatch_now(self, records: list[tuple[dict[str, Any], LogLevel]]) -> None:
+        """Dispatch a batch of (payload, level) records to all sinks."""
+        for mask, emit, emit_many, name in self._sink_table:
             try:
-                log_level = LogLevel(payload.get("level", "info"))
-                if sink._should_log(log_level):
-                    sink.emit(payload)
+                accepted = [
+                    payload for payload, level in records if mask & (1 << level.rank)
+                ]
+                if not accepted:
+                    continue
+                if len(accepted) == 1:
+                    emit(accepted[0])
+                else:
+                    emit_many(accepted)
             except Exception as exc:
-                print(
-                    f"Sink {sink.__class__.__name__} failed: {exc}",
-                    file=sys.stderr,
-                )
+                self._warner.warn(name, f"Sink {name} failed: {exc}")
 
     def log_endpoint(
         self,
@@ -96,23 +282,18 @@ class _LoggerCore:
             body: Request body
             context: Additional context to include
         """
-        self.log(
-            f"Endpoint Invoked: {endpoint_name}",
-            LogLevel.INFO,
-            {
-                "event_source": "http_endpoint",
-                "event_type": "endpoint_invocation",
-                "endpoint_name": endpoint_name,
-                "request": {
-                    "method": method,
-                    "path": path,
-                    "query": query_params or {},
-                    "headers": headers,
-                    "body": body,
-                },
-                **(context or {}),
-            },
-        )
+        content = _ENDPOINT_EVENT_TEMPLATE.copy()
+        content["endpoint_name"] = endpoint_name
+        content["request"] = {
+            "method": method,
+            "path": path,
+            "query": query_params or {},
+            "headers": headers,
+            "body": body,
+        }
+        if context:
+            content.update(context)
+        self.log(f"Endpoint Invoked: {endpoint_name}", LogLevel.INFO, content)
 
     def log_exception(
         self,
@@ -128,6 +309,10 @@ class _LoggerCore:
             exception: The exception object
             context: Additional context to include
         """
+        # Formatting a traceback walks frames and reads source lines off
+        # disk, so skip it entirely when no sink will accept ERROR.
+        if not self._level_enabled(LogLevel.ERROR):
+            return
         tb_lines = tb.format_exception(
             type(exception),
             exception,
@@ -147,15 +332,39 @@ class _LoggerCore:
         )
 
     def close(self) -> None:
-        """Close all sinks."""
+        """Flush any queued payloads, stop the worker, and close all sinks."""
+        if self._worker is not None:
+            assert self._queue is not None
+            self._queue.put(_STOP)
+            self._worker.join()
+            self._queue = None
+            self._worker = None
         for sink in self.sinks:
             try:
                 sink.close()
             except Exception as exc:
-                print(
-                    f"Sink {sink.__class__.__name__} close failed: {exc}",
-                    file=sys.stderr,
-                )
+                name = sink.__class__.__name__
+                self._warner.warn(f"{name}.close", f"Sink {name} close failed: {exc}")
+
+
+def _caller_info() -> dict[str, Any]:
+    """Locate the first frame outside multilog and describe it.
+
+    Uses sys._getframe plus a short f_back walk over multilog-internal
+    frames; never inspect.stack(), which formats the whole call stack.
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        name = frame.f_globals.get("__name__", "")
+        # Match the multilog package only, not user modules whose names
+        # merely begin with "multilog" (e.g. multilog_utils).
+        if name != "multilog" and not name.startswith("multilog."):
+            break
+        frame = frame.f_back
+    if frame is None:
+        return {}
+    code = frame.f_code
+    return {"file": code.co_filename, "line": frame.f_lineno, "function": code.co_name}
 
 
 def _default_sinks() -> list[BaseSink]:
@@ -176,6 +385,10 @@ def _default_sinks() -> list[BaseSink]:
             raise ConfigError(
                 "BETTERSTACK_TOKEN is set but BETTERSTACK_INGEST_URL is missing"
             )
+        # Imported here so processes without Betterstack configured
+        # never pay the httpx import (see sinks/__init__ lazy export).
+        from multilog.sinks.betterstack import BetterstackSink
+
         sinks.append(BetterstackSink(token=token, ingest_url=ingest_url))
 
     return sinks
@@ -0,0 +1,41 @@
+"""Internal JSON encoding helpers for multilog-py.
+
+Prefers msgspec, then orjson (both covered by the ``fast-json`` extra),
+falling back to the stdlib json module. The optional encoders serialize
+via C directly to UTF-8 bytes, which is several times faster than
+json.dumps for typical log payloads.
+"""
+
+import json
+from typing import Any
+
+try:
+    from msgspec.json import Encoder as _MsgspecEncoder
+except ImportError:
+    _MsgspecEncoder = None
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+if _MsgspecEncoder is not None:
+    _encode_bytes = _MsgspecEncoder().encode
+elif _orjson is not None:
+    _encode_bytes = _orjson.dumps
+else:
+    _encode_bytes = None
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Encode obj to UTF-8 JSON bytes using the fastest available encoder."""
+    if _encode_bytes is not None:
+        return _encode_bytes(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    """Encode obj to a JSON string using the fastest available encoder."""
+    if _encode_bytes is not None:
+        return _encode_bytes(obj).decode("utf-8")
+    return json.dumps(obj)
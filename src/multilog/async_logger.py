@@ -3,30 +3,59 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import contextvars
 from typing import Any
 
-from multilog._core import _LoggerCore
+from multilog._core import _STOP, _LoggerCore
 from multilog.levels import LogLevel
 from multilog.sinks.base import BaseSink
 
 
+async def _run_sync(func, /, *args: Any) -> Any:
+    """
+    Run a synchronous callable in the default executor.
+
+    Like asyncio.to_thread, but skips contextvars propagation when the
+    current context is empty (the common case for sink I/O), avoiding
+    the functools.partial allocation and ctx.run frame per call.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    if not len(ctx):
+        return await loop.run_in_executor(None, func, *args)
+    return await loop.run_in_executor(None, ctx.run, func, *args)
+
+
 class AsyncLogger:
     """
     Asynchronous logger that wraps _LoggerCore.
 
-    All logging methods are async and run the synchronous core methods
+    All logging methods are async. By default the synchronous core runs
     in a thread executor via asyncio.to_thread(), keeping the event loop
     unblocked during sink I/O (file writes, HTTP requests, etc.).
 
+    With ``async_sinks=True``, log() instead enqueues the payload on an
+    asyncio.Queue (a plain put, no thread hop) and a single background
+    task drains the queue in batches, paying one executor round trip
+    per batch rather than per record. The queue is bounded (max_queue):
+    when sinks fall behind, the oldest records are dropped rather than
+    growing memory or blocking the caller, and a WARN summary with the
+    drop count is emitted once pressure releases.
+
     Example:
         async with AsyncLogger() as logger:
             await logger.log("User action", LogLevel.INFO, {"user_id": 123})
     """
 
+    __slots__ = ("_core", "_use_queue", "_max_queue", "_dropped", "_queue", "_drain_task")
+
     def __init__(
         self,
         sinks: list[BaseSink] | None = None,
         default_context: dict[str, Any] | None = None,
+        async_sinks: bool = False,
+        max_queue: int = 10_000,
     ):
         """
         Initialize the async logger.
@@ -34,8 +63,18 @@ class AsyncLogger:
         Args:
             sinks: List of log sinks. If None, creates sinks from env.
             default_context: Context merged into all log entries.
+            async_sinks: If True, deliver to sinks from a background
+                task so log calls never block on sink I/O.
+            max_queue: Bound on queued records with async_sinks; when
+                full, the oldest record is dropped (never the caller
+                blocked) and the drops are reported in a WARN summary.
         """
         self._core = _LoggerCore(sinks, default_context)
+        self._use_queue = async_sinks
+        self._max_queue = max_queue
+        self._dropped = 0
+        self._queue: asyncio.Queue | None = None
+        self._drain_task: asyncio.Task | None = None
 
     async def log(
         self,
@@ -46,14 +85,69 @@ class AsyncLogger:
         """
         Send a log entry to all configured sinks.
 
-        Runs in a thread executor to avoid blocking the event loop.
+        With async_sinks this only builds the payload and enqueues it;
+        otherwise it runs the core in a thread executor to avoid
+        blocking the event loop.
 
         Args:
             message: Log message
             level: Log level
             content: Additional metadata to include
         """
-        await asyncio.to_thread(self._core.log, message, level, content)
+        if self._use_queue:
+            core = self._core
+            if not core._level_enabled(level):
+                return
+            payload = core._build_payload(message, level, content)
+            self._ensure_drain_task()
+            assert self._queue is not None
+            try:
+                self._queue.put_nowait((payload, level))
+            except asyncio.QueueFull:
+                # Drop-oldest: bound memory under sink stalls without
+                # ever blocking the caller.
+                with contextlib.suppress(asyncio.QueueEmpty):
+                    self._queue.get_nowait()
+                self._dropped += 1
+                self._queue.put_nowait((payload, level))
+            return
+        await _run_sync(self._core.log, message, level, content)
+
+    def _ensure_drain_task(self) -> None:
+        """Start the queue drain task lazily (requires a running loop)."""
+        if self._drain_task is None:
+            self._queue = asyncio.Queue(maxsize=self._max_queue)
+            self._drain_task = asyncio.get_running_loop().create_task(self._drain())
+
+    async def _drain(self) -> None:
+        """Drain task: deliver queued records in batches off the loop."""
+        assert self._queue is not None
+        while True:
+            item = await self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            stop = False
+            while len(batch) < self._core.max_batch:
+                try:
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            if self._dropped and self._queue.empty():
+                dropped, self._dropped = self._dropped, 0
+                summary = self._core._build_payload(
+                    f"Dropped {dropped} log records under queue pressure",
+                    LogLevel.WARN,
+                    {"dropped_records": dropped},
+                )
+                batch.append((summary, LogLevel.WARN))
+            await _run_sync(self._core._dispatch_now, batch)
+            if stop:
+                return
 
     async def log_endpoint(
         self,
@@ -79,7 +173,7 @@ class AsyncLogger:
             body: Request body
             context: Additional context to include
         """
-        await asyncio.to_thread(
+        await _run_sync(
             self._core.log_endpoint,
             endpoint_name,
             method,
@@ -106,11 +200,19 @@ class AsyncLogger:
             exception: The exception object
             context: Additional context to include
         """
-        await asyncio.to_thread(self._core.log_exception, message, exception, context)
+        await _run_sync(self._core.log_exception, message, exception, context)
 
     async def close(self) -> None:
-        """Close all sinks. Runs in a thread executor."""
-        await asyncio.to_thread(self._core.close)
+        """Flush any queued records, then close all sinks."""
+        if self._drain_task is not None:
+            assert self._queue is not None
+            # Blocking put: the drain task frees a slot if the queue is
+            # full, and the sentinel must never be dropped.
+            await self._queue.put(_STOP)
+            await self._drain_task
+            self._drain_task = None
+            self._queue = None
+        await _run_sync(self._core.close)
 
     async def __aenter__(self) -> AsyncLogger:
         """Enter async context manager."""
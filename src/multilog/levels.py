@@ -19,19 +19,13 @@ class _LogLevelMeta(EnumType):
         """Resolve a string or member to a LogLevel member."""
         if isinstance(key, cls):
             return cast("LogLevel", key)
-        try:
-            return cast("LogLevel", cls(key))
-        except ValueError:
-            return cast("LogLevel", cls._member_map_[key])
+        return cast("LogLevel", _RESOLVER[key])
 
     def __getitem__(cls, key: str) -> "LogLevel":  # type: ignore[invalid-method-override]
         if isinstance(key, slice):
-            members = cast('list["LogLevel"]', list(cls))
-            start = cls._resolve_member(key.start) if key.start is not None else members[0]
-            stop = cls._resolve_member(key.stop) if key.stop is not None else members[-1]
-            start_idx = members.index(start)
-            stop_idx = members.index(stop)
-            return cast("LogLevel", members[start_idx : stop_idx + 1])
+            start = cls._resolve_member(key.start) if key.start is not None else _MEMBERS[0]
+            stop = cls._resolve_member(key.stop) if key.stop is not None else _MEMBERS[-1]
+            return cast("LogLevel", list(_MEMBERS[start.rank : stop.rank + 1]))
         return cast("LogLevel", super().__getitem__(key))
 
 
@@ -60,6 +54,10 @@ class LogLevel(StrEnum, metaclass=_LogLevelMeta):
         LogLevel.INFO < LogLevel.FATAL    # True
     """
 
+    # Severity index assigned after the class body (a bare annotation
+    # does not create an enum member); declared here for type checkers.
+    rank: int
+
     TRACE = "trace"
     DEBUG = "debug"
     INFO = "info"
@@ -69,24 +67,40 @@ class LogLevel(StrEnum, metaclass=_LogLevelMeta):
 
     def __ge__(self, other):
         if isinstance(other, LogLevel):
-            members = list(LogLevel)
-            return members.index(self) >= members.index(other)
+            return self.rank >= other.rank
         return NotImplemented
 
     def __gt__(self, other):
         if isinstance(other, LogLevel):
-            members = list(LogLevel)
-            return members.index(self) > members.index(other)
+            return self.rank > other.rank
         return NotImplemented
 
     def __le__(self, other):
         if isinstance(other, LogLevel):
-            members = list(LogLevel)
-            return members.index(self) <= members.index(other)
+            return self.rank <= other.rank
         return NotImplemented
 
     def __lt__(self, other):
         if isinstance(other, LogLevel):
-            members = list(LogLevel)
-            return members.index(self) < members.index(other)
+            return self.rank < other.rank
         return NotImplemented
+
+
+# Severity rank (TRACE=0 .. FATAL=5) cached on each member so level
+# comparisons and sink filters are single int operations instead of
+# list(LogLevel).index scans. _MEMBERS backs slice resolution in the
+# metaclass without rebuilding list(LogLevel) per lookup.
+for _rank, _member in enumerate(LogLevel):
+    _member.rank = _rank
+del _rank, _member
+
+_MEMBERS: tuple[LogLevel, ...] = tuple(LogLevel)
+
+# Combined value ("info") and name ("INFO") lookup table so slice
+# endpoints resolve with one dict get instead of the EnumMeta value
+# call plus a _member_map_ fallback. Unknown keys raise KeyError, as
+# the _member_map_ fallback did.
+_RESOLVER: dict[str, LogLevel] = {
+    **{member.value: member for member in LogLevel},
+    **{member.name: member for member in LogLevel},
+}
@@ -25,10 +25,14 @@ class Logger:
             logger.log("Starting", LogLevel.INFO)
     """
 
+    __slots__ = ("_core",)
+
     def __init__(
         self,
         sinks: list[BaseSink] | None = None,
         default_context: dict[str, Any] | None = None,
+        async_sinks: bool = False,
+        include_caller: bool = False,
     ):
         """
         Initialize logger.
@@ -36,8 +40,17 @@ class Logger:
         Args:
             sinks: List of log sinks. If None, creates sinks from env.
             default_context: Context merged into all log entries.
+            async_sinks: If True, deliver to sinks from a background
+                thread so log calls never block on sink I/O.
+            include_caller: If True, add a "caller" entry (file, line,
+                function) to each payload, captured via sys._getframe.
         """
-        self._core = _LoggerCore(sinks, default_context)
+        self._core = _LoggerCore(
+            sinks,
+            default_context,
+            async_sinks=async_sinks,
+            include_caller=include_caller,
+        )
 
     def log(
         self,
@@ -1,13 +1,28 @@
 """Sink exports for multilog-py."""
 
+from typing import TYPE_CHECKING
+
 from multilog.sinks.base import BaseSink
-from multilog.sinks.betterstack import BetterstackSink
 from multilog.sinks.console import ConsoleSink
 from multilog.sinks.file import FileSink
 
+if TYPE_CHECKING:
+    from multilog.sinks.betterstack import BetterstackSink
+
 __all__ = [
     "BaseSink",
     "BetterstackSink",
     "ConsoleSink",
     "FileSink",
 ]
+
+
+def __getattr__(name: str):
+    # PEP 562 lazy export: BetterstackSink pulls in httpx, which is a
+    # noticeable import cost for users who only log to console/file.
+    if name == "BetterstackSink":
+        from multilog.sinks.betterstack import BetterstackSink
+
+        globals()[name] = BetterstackSink
+        return BetterstackSink
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,12 +3,20 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+from multilog import _json
 from multilog.levels import LogLevel
 
+# Shared by every sink constructed without an explicit level filter, so
+# the default path allocates no per-instance list and skips the mask loop.
+_ALL_LEVELS: tuple[LogLevel, ...] = tuple(LogLevel)
+_ALL_LEVELS_MASK = (1 << len(_ALL_LEVELS)) - 1
+
 
 class BaseSink(ABC):
     """Abstract base class for log sinks."""
 
+    __slots__ = ("default_context", "included_levels", "_context_json", "_level_mask")
+
     def __init__(
         self,
         default_context: dict[str, Any] | None = None,
@@ -22,8 +30,19 @@ class BaseSink(ABC):
             included_levels: Log levels this sink will emit. Defaults to all levels.
         """
         self.default_context = dict(default_context or {})
-        self.included_levels = (
-            list(included_levels) if included_levels is not None else list(LogLevel)
+        # Bitmask over level ranks so _should_log is a single int AND.
+        if included_levels is None:
+            self.included_levels = _ALL_LEVELS
+            self._level_mask = _ALL_LEVELS_MASK
+        else:
+            self.included_levels = tuple(included_levels)
+            self._level_mask = 0
+            for included in self.included_levels:
+                self._level_mask |= 1 << included.rank
+        # Serialized once so JSON sinks don't re-encode the constant
+        # context keys on every record (braces stripped for splicing).
+        self._context_json = (
+            _json.dumps(self.default_context)[1:-1] if self.default_context else ""
         )
 
     def emit(self, payload: dict[str, Any]) -> None:
@@ -36,6 +55,41 @@ class BaseSink(ABC):
         merged = {**self.default_context, **payload} if self.default_context else payload
         self._emit(merged)
 
+    def emit_many(self, payloads: list[dict[str, Any]]) -> None:
+        """
+        Emit a batch of log entries.
+
+        Default implementation falls back to per-payload emit(). Sinks
+        that can amortize per-call overhead (e.g. one HTTP request per
+        batch) should override this.
+
+        Args:
+            payloads: List of log payload dictionaries
+        """
+        for payload in payloads:
+            self.emit(payload)
+
+    def _encode(self, payload: dict[str, Any]) -> str:
+        """
+        Serialize payload to JSON with default_context folded in.
+
+        Splices the JSON prefix cached at construction time ahead of the
+        payload instead of merging dicts and re-encoding the constant
+        context keys per record. Duplicate keys resolve in favor of the
+        payload (later keys win), matching emit()'s merge semantics.
+
+        Args:
+            payload: Log payload to serialize (without sink context)
+
+        Returns:
+            JSON object string containing context and payload keys
+        """
+        if not self._context_json:
+            return _json.dumps(payload)
+        if not payload:
+            return "{" + self._context_json + "}"
+        return "{" + self._context_json + "," + _json.dumps(payload)[1:]
+
     @abstractmethod
     def _emit(self, payload: dict[str, Any]) -> None:
         """
@@ -65,4 +119,4 @@ class BaseSink(ABC):
         Returns:
             True if the log level is in included_levels, False otherwise
         """
-        return log_level in self.included_levels
+        return bool(self._level_mask & (1 << log_level.rank))
@@ -1,5 +1,7 @@
 """Betterstack sink for multilog-py."""
 
+import gzip
+import time
 from typing import Any
 
 import httpx
@@ -7,10 +9,23 @@ import httpx
 from multilog.levels import LogLevel
 from multilog.sinks.base import BaseSink
 
+# Bodies below this size skip compression: the gzip header/dictionary
+# overhead cancels the savings and single small events dominate the
+# non-batched path.
+_GZIP_MIN_SIZE = 512
+
+_GZIP_HEADERS = {"Content-Encoding": "gzip"}
+
+# Retry schedule for transient failures (transport errors and 5xx):
+# attempt, sleep 0.2s, attempt, sleep 0.4s, final attempt, then raise.
+_RETRY_DELAYS = (0.2, 0.4)
+
 
 class BetterstackSink(BaseSink):
     """Sink for sending logs to Betterstack."""
 
+    __slots__ = ("token", "ingest_url", "timeout", "_client")
+
     def __init__(
         self,
         token: str,
@@ -39,13 +54,50 @@ class BetterstackSink(BaseSink):
         """
         Lazy initialize HTTP client.
 
+        The client is created once with auth headers and keep-alive
+        pooling so every POST reuses one TCP+TLS connection instead of
+        paying a handshake per request. HTTP/2 is enabled when the h2
+        package is installed (the ``http2`` extra).
+
         Returns:
             httpx.Client instance
         """
         if self._client is None:
-            self._client = httpx.Client(timeout=self.timeout)
+            kwargs: dict[str, Any] = {
+                "timeout": self.timeout,
+                "headers": {
+                    "Authorization": f"Bearer {self.token}",
+                    "Content-Type": "application/json",
+                },
+                "limits": httpx.Limits(
+                    max_connections=4,
+                    max_keepalive_connections=4,
+                    keepalive_expiry=60.0,
+                ),
+                # Retry connect failures; HTTP-level errors still surface
+                # through raise_for_status.
+                "transport": httpx.HTTPTransport(retries=2),
+            }
+            try:
+                self._client = httpx.Client(http2=True, **kwargs)
+            except ImportError:
+                # h2 not installed; HTTP/1.1 keep-alive still reuses the
+                # pooled connection.
+                self._client = httpx.Client(**kwargs)
         return self._client
 
+    def emit(self, payload: dict[str, Any]) -> None:
+        """
+        Send a log entry, folding default_context in during serialization.
+
+        Skips BaseSink's per-record dict merge: _encode splices the
+        pre-serialized context prefix into the request body instead.
+
+        Args:
+            payload: Dictionary containing log data
+        """
+        self._emit(payload)
+
     def _emit(self, payload: dict[str, Any]) -> None:
         """
         Send log to Betterstack via HTTP POST.
@@ -53,16 +105,53 @@ class BetterstackSink(BaseSink):
         Args:
             payload: Log payload to send
         """
+        self._post(self._encode(payload))
+
+    def emit_many(self, payloads: list[dict[str, Any]]) -> None:
+        """
+        Send a batch of logs to Betterstack in a single HTTP POST.
+
+        Betterstack accepts a JSON array of events at the ingest URL, so
+        a whole batch costs one round trip instead of one per record.
+
+        Args:
+            payloads: List of log payloads to send
+        """
+        self._post("[" + ",".join(self._encode(payload) for payload in payloads) + "]")
+
+    def _post(self, body: str) -> None:
+        """
+        POST a pre-serialized JSON body (event or array) to the ingest URL.
+
+        Bodies past _GZIP_MIN_SIZE are gzipped (level 1: near-free CPU,
+        still ~70% smaller for JSON logs) so batches cost a fraction of
+        the bytes on the wire.
+
+        Transient failures (transport errors, 5xx responses) are retried
+        with exponential backoff per _RETRY_DELAYS before the error is
+        allowed to surface; 4xx responses raise immediately since
+        retrying a rejected payload cannot succeed.
+        """
         client = self._get_client()
 
-        response = client.post(
-            self.ingest_url,
-            headers={
-                "Authorization": f"Bearer {self.token}",
-                "Content-Type": "application/json",
-            },
-            json=payload,
-        )
+        content = body.encode("utf-8")
+        headers = None
+        if len(content) >= _GZIP_MIN_SIZE:
+            content = gzip.compress(content, compresslevel=1)
+            headers = _GZIP_HEADERS
+
+        for delay in _RETRY_DELAYS:
+            try:
+                response = client.post(self.ingest_url, content=content, headers=headers)
+                response.raise_for_status()
+                return
+            except httpx.TransportError:
+                pass
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code < 500:
+                    raise
+            time.sleep(delay)
+        response = client.post(self.ingest_url, content=content, headers=headers)
         response.raise_for_status()
 
     def close(self) -> None:
@@ -1,17 +1,41 @@
 """Console sink for multilog-py."""
 
-import json
 import sys
-from datetime import UTC, datetime
+import time
 from typing import Any
 
+from multilog import _json
 from multilog.levels import LogLevel
 from multilog.sinks.base import BaseSink
 
+# Levels routed to stderr rather than stdout.
+_STDERR_LEVELS = frozenset(("warn", "error", "fatal"))
+
+# Payload keys rendered inline rather than in the context trailer.
+_EXCLUDED_KEYS = frozenset(("level", "message", "timestamp_ms"))
+
+# LRU-1 cache for the formatted second: strftime runs at most once per
+# second of log traffic, and the ms suffix is spliced on per record.
+# A race between threads just recomputes the same string.
+_last_sec = -1
+_last_sec_str = ""
+
+
+def _format_timestamp(timestamp_ms: int) -> str:
+    """Format epoch ms as 'YYYY-mm-dd HH:MM:SS.mmm' (UTC, 23 chars)."""
+    global _last_sec, _last_sec_str
+    sec, ms = divmod(timestamp_ms, 1000)
+    if sec != _last_sec:
+        _last_sec_str = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(sec))
+        _last_sec = sec
+    return f"{_last_sec_str}.{ms:03d}"
+
 
 class ConsoleSink(BaseSink):
     """Sink for logging to console (stdout/stderr)."""
 
+    __slots__ = ("use_color", "_level_tags")
+
     # ANSI color codes
     COLORS = {
         "trace": "\033[90m",  # Bright black (gray)
@@ -39,42 +63,74 @@ class ConsoleSink(BaseSink):
         """
         super().__init__(default_context=default_context, included_levels=included_levels)
         self.use_color = use_color
-
-    def _emit(self, payload: dict[str, Any]) -> None:
+        # Fixed-width level tags (color codes baked in when enabled)
+        # precomputed once so _format never rebuilds the decoration.
+        self._level_tags: dict[str, str] = {}
+        for lv in LogLevel:
+            tag = lv.value.upper().ljust(5)
+            if use_color:
+                tag = f"{self.COLORS.get(lv.value, '')}{tag}{self.COLORS['reset']}"
+            self._level_tags[lv.value] = tag
+
+    def _format(self, payload: dict[str, Any]) -> tuple[str, bool]:
         """
-        Print formatted log to stdout or stderr.
+        Format a payload into a newline-terminated console line.
 
         Format: timestamp  LEVEL  message  {context}
 
         Args:
-            payload: Log payload to print
+            payload: Log payload to format
+
+        Returns:
+            Tuple of (formatted line, True if it belongs on stderr)
         """
         level = payload.get("level", "info")
         message = payload.get("message", "")
         timestamp_ms = payload.get("timestamp_ms", 0)
 
         # Convert epoch ms to human-readable timestamp (fixed 23-char width)
-        dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=UTC)
-        timestamp = dt.strftime("%Y-%m-%d %H:%M:%S.") + f"{dt.microsecond // 1000:03d}"
-
-        # Determine output stream (stderr for errors/warnings/fatal, stdout otherwise)
-        stream = sys.stderr if level in ("error", "warn", "fatal") else sys.stdout
-
-        # Fixed-width level (5 chars, left-aligned to cover all named levels).
-        level_str = level.upper().ljust(5)
-
-        # Format the log line
-        if self.use_color:
-            color = self.COLORS.get(level, "")
-            reset = self.COLORS["reset"]
-            formatted = f"{timestamp}  {color}{level_str}{reset}  {message}"
-        else:
-            formatted = f"{timestamp}  {level_str}  {message}"
-
-        # Add context if present
-        excluded_keys = ("level", "message", "timestamp_ms")
-        context = {k: v for k, v in payload.items() if k not in excluded_keys}
+        timestamp = _format_timestamp(timestamp_ms)
+
+        tag = self._level_tags.get(level)
+        if tag is None:
+            tag = level.upper().ljust(5)
+
+        formatted = f"{timestamp}  {tag}  {message}"
+
+        # Add context if present. C-level copy plus three pops beats a
+        # comprehension re-hashing every key against the exclusion set.
+        context = payload.copy()
+        for key in _EXCLUDED_KEYS:
+            context.pop(key, None)
         if context:
-            formatted += f"  {json.dumps(context)}"
+            formatted += f"  {_json.dumps(context)}"
 
-        print(formatted, file=stream)
+        return formatted + "\n", level in _STDERR_LEVELS
+
+    def _emit(self, payload: dict[str, Any]) -> None:
+        """
+        Write a formatted log line to stdout or stderr.
+
+        Args:
+            payload: Log payload to print
+        """
+        line, is_err = self._format(payload)
+        (sys.stderr if is_err else sys.stdout).write(line)
+
+    def emit_many(self, payloads: list[dict[str, Any]]) -> None:
+        """
+        Write a batch of log lines with one writelines call per stream.
+
+        Args:
+            payloads: List of log payload dictionaries
+        """
+        out_lines: list[str] = []
+        err_lines: list[str] = []
+        for payload in payloads:
+            merged = {**self.default_context, **payload} if self.default_context else payload
+            line, is_err = self._format(merged)
+            (err_lines if is_err else out_lines).append(line)
+        if out_lines:
+            sys.stdout.writelines(out_lines)
+        if err_lines:
+            sys.stderr.writelines(err_lines)
@@ -1,6 +1,5 @@
 """File sink for multilog-py."""
 
-import json
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +10,8 @@ from multilog.sinks.base import BaseSink
 class FileSink(BaseSink):
     """Sink for logging to a file in JSONL format."""
 
+    __slots__ = ("file_path", "_file")
+
     def __init__(
         self,
         file_path: str | Path,
@@ -33,9 +34,26 @@ class FileSink(BaseSink):
         # Ensure parent directory exists
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # append=False means truncate once at startup, then append new entries.
-        if not append:
-            self.file_path.write_text("", encoding="utf-8")
+        # One persistent buffered handle instead of an open/close per
+        # record. append=False truncates once at startup ("w"), then
+        # appends new entries.
+        self._file = self.file_path.open(
+            mode="a" if append else "w",
+            buffering=64 * 1024,
+            encoding="utf-8",
+        )
+
+    def emit(self, payload: dict[str, Any]) -> None:
+        """
+        Write a log entry, folding default_context in during serialization.
+
+        Skips BaseSink's per-record dict merge: _encode splices the
+        pre-serialized context prefix into the JSON line instead.
+
+        Args:
+            payload: Dictionary containing log data
+        """
+        self._emit(payload)
 
     def _emit(self, payload: dict[str, Any]) -> None:
         """
@@ -44,5 +62,20 @@ class FileSink(BaseSink):
         Args:
             payload: Log payload to write
         """
-        with self.file_path.open(mode="a", encoding="utf-8") as f:
-            f.write(json.dumps(payload) + "\n")
+        self._file.write(self._encode(payload) + "\n")
+        self._file.flush()
+
+    def emit_many(self, payloads: list[dict[str, Any]]) -> None:
+        """
+        Write a batch of log entries with one writelines and one flush.
+
+        Args:
+            payloads: List of log payloads to write
+        """
+        self._file.writelines(self._encode(payload) + "\n" for payload in payloads)
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the underlying file handle."""
+        if not self._file.closed:
+            self._file.close()
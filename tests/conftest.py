@@ -0,0 +1,31 @@
+"""Shared fixtures for the multilog-py test suite."""
+
+import threading
+from typing import Any
+
+import pytest
+
+from multilog.sinks.base import BaseSink
+
+
+class RecordingSink(BaseSink):
+    """Minimal concrete sink that records emitted payloads.
+
+    Also records the emitting thread name so dispatch tests can assert
+    whether delivery happened inline or on a worker.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.payloads: list[dict[str, Any]] = []
+        self.emit_threads: list[str] = []
+
+    def _emit(self, payload: dict[str, Any]) -> None:
+        self.payloads.append(payload)
+        self.emit_threads.append(threading.current_thread().name)
+
+
+@pytest.fixture
+def recording_sink_cls() -> type[RecordingSink]:
+    """The shared recording sink class (call it to build sinks)."""
+    return RecordingSink
@@ -0,0 +1,36 @@
+"""Tests for background (async_sinks) dispatch in _LoggerCore."""
+
+import threading
+
+from multilog._core import _LoggerCore
+from multilog.levels import LogLevel
+
+
+class TestAsyncSinks:
+    def test_default_dispatch_is_inline(self, recording_sink_cls):
+        sink = recording_sink_cls()
+        core = _LoggerCore(sinks=[sink])
+
+        core.log("hello", LogLevel.INFO)
+
+        assert [p["message"] for p in sink.payloads] == ["hello"]
+        assert sink.emit_threads == [threading.current_thread().name]
+
+    def test_async_sinks_delivers_all_payloads_on_close(self, recording_sink_cls):
+        sink = recording_sink_cls()
+        core = _LoggerCore(sinks=[sink], async_sinks=True)
+
+        for i in range(10):
+            core.log(f"msg {i}", LogLevel.INFO)
+        core.close()
+
+        assert [p["message"] for p in sink.payloads] == [f"msg {i}" for i in range(10)]
+
+    def test_async_sinks_emits_off_caller_thread(self, recording_sink_cls):
+        sink = recording_sink_cls()
+        core = _LoggerCore(sinks=[sink], async_sinks=True)
+
+        core.log("hello", LogLevel.INFO)
+        core.close()
+
+        assert sink.emit_threads != [threading.current_thread().name]
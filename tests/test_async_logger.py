@@ -0,0 +1,58 @@
+"""Tests for AsyncLogger dispatch, including the async_sinks queue path."""
+
+import asyncio
+
+from multilog import AsyncLogger, LogLevel
+
+
+class TestAsyncLogger:
+    def test_default_path_delivers_inline(self, recording_sink_cls):
+        sink = recording_sink_cls()
+
+        async def scenario():
+            async with AsyncLogger(sinks=[sink]) as logger:
+                await logger.log("hello", LogLevel.INFO)
+
+        asyncio.run(scenario())
+
+        assert [p["message"] for p in sink.payloads] == ["hello"]
+
+    def test_async_sinks_delivers_all_payloads_on_close(self, recording_sink_cls):
+        sink = recording_sink_cls()
+
+        async def scenario():
+            async with AsyncLogger(sinks=[sink], async_sinks=True) as logger:
+                for i in range(10):
+                    await logger.log(f"msg {i}", LogLevel.INFO)
+
+        asyncio.run(scenario())
+
+        assert [p["message"] for p in sink.payloads] == [f"msg {i}" for i in range(10)]
+
+    def test_async_sinks_drops_oldest_when_queue_full(self, recording_sink_cls):
+        sink = recording_sink_cls()
+
+        async def scenario():
+            async with AsyncLogger(sinks=[sink], async_sinks=True, max_queue=4) as logger:
+                # No awaits yield to the drain task between puts, so the
+                # queue overflows deterministically.
+                for i in range(10):
+                    await logger.log(f"msg {i}", LogLevel.INFO)
+
+        asyncio.run(scenario())
+
+        messages = [p["message"] for p in sink.payloads]
+        assert messages[:4] == [f"msg {i}" for i in range(6, 10)]
+        assert sink.payloads[-1]["dropped_records"] == 6
+
+    def test_async_sinks_respects_level_filter(self, recording_sink_cls):
+        sink = recording_sink_cls(included_levels=LogLevel[LogLevel.INFO :])
+
+        async def scenario():
+            async with AsyncLogger(sinks=[sink], async_sinks=True) as logger:
+                await logger.log("keep", LogLevel.INFO)
+                await logger.log("drop", LogLevel.DEBUG)
+
+        asyncio.run(scenario())
+
+        assert [p["message"] for p in sink.payloads] == ["keep"]
@@ -1,37 +1,23 @@
 """Tests for BaseSink: level filtering and context merging."""
 
-from typing import Any
-
 from multilog.levels import LogLevel
-from multilog.sinks.base import BaseSink
-
-
-class _ConcreteSink(BaseSink):
-    """Minimal concrete sink that records emitted payloads."""
-
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.payloads: list[dict[str, Any]] = []
-
-    def _emit(self, payload: dict[str, Any]) -> None:
-        self.payloads.append(payload)
 
 
 class TestShouldLog:
-    def test_default_accepts_all_levels(self):
-        sink = _ConcreteSink()
+    def test_default_accepts_all_levels(self, recording_sink_cls):
+        sink = recording_sink_cls()
 
         for level in LogLevel:
             assert sink._should_log(level) is True
 
-    def test_custom_included_levels_accepts_listed(self):
-        sink = _ConcreteSink(included_levels=[LogLevel.INFO, LogLevel.ERROR])
+    def test_custom_included_levels_accepts_listed(self, recording_sink_cls):
+        sink = recording_sink_cls(included_levels=[LogLevel.INFO, LogLevel.ERROR])
 
         assert sink._should_log(LogLevel.INFO) is True
         assert sink._should_log(LogLevel.ERROR) is True
 
-    def test_custom_included_levels_rejects_unlisted(self):
-        sink = _ConcreteSink(included_levels=[LogLevel.INFO, LogLevel.ERROR])
+    def test_custom_included_levels_rejects_unlisted(self, recording_sink_cls):
+        sink = recording_sink_cls(included_levels=[LogLevel.INFO, LogLevel.ERROR])
 
         assert sink._should_log(LogLevel.TRACE) is False
         assert sink._should_log(LogLevel.DEBUG) is False
@@ -40,8 +26,8 @@ class TestShouldLog:
 
 
 class TestEmitContextMerging:
-    def test_default_context_merged_into_payload(self):
-        sink = _ConcreteSink(default_context={"env": "test"})
+    def test_default_context_merged_into_payload(self, recording_sink_cls):
+        sink = recording_sink_cls(default_context={"env": "test"})
 
         sink.emit({"message": "hello", "level": "info"})
 
@@ -50,8 +36,8 @@ class TestEmitContextMerging:
         assert payload["message"] == "hello"
         assert payload["level"] == "info"
 
-    def test_payload_keys_override_default_context(self):
-        sink = _ConcreteSink(default_context={"env": "test", "source": "default"})
+    def test_payload_keys_override_default_context(self, recording_sink_cls):
+        sink = recording_sink_cls(default_context={"env": "test", "source": "default"})
 
         sink.emit({"message": "hello", "source": "override"})
 
@@ -59,10 +45,20 @@ class TestEmitContextMerging:
         assert payload["source"] == "override"
         assert payload["env"] == "test"
 
-    def test_no_default_context_passes_through_unchanged(self):
-        sink = _ConcreteSink()
+    def test_no_default_context_passes_through_unchanged(self, recording_sink_cls):
+        sink = recording_sink_cls()
         original = {"message": "hello", "level": "info"}
 
         sink.emit(original)
 
         assert sink.payloads[0] is original
+
+
+class TestEmitMany:
+    def test_default_emit_many_falls_back_to_emit(self, recording_sink_cls):
+        sink = recording_sink_cls(default_context={"env": "test"})
+
+        sink.emit_many([{"message": "a"}, {"message": "b"}])
+
+        assert [p["message"] for p in sink.payloads] == ["a", "b"]
+        assert all(p["env"] == "test" for p in sink.payloads)
@@ -0,0 +1,31 @@
+"""Perf smoke tests guarding hot-path regressions.
+
+These are not precise benchmarks: the bounds are orders of magnitude
+above the expected cost so they only trip on gross regressions (e.g.
+slice resolution falling back to an O(n) scan per call), never on a
+slow CI machine. Deselect with -m "not benchmark".
+"""
+
+import time
+
+import pytest
+
+from multilog.levels import LogLevel
+
+pytestmark = pytest.mark.benchmark
+
+_ITERATIONS = 10_000
+
+
+def test_slice_resolution_stays_cheap():
+    # Warm up the resolver and verify correctness once.
+    result = LogLevel[LogLevel.INFO : LogLevel.FATAL]
+    assert result[-1] is LogLevel.FATAL
+
+    start = time.perf_counter()
+    for _ in range(_ITERATIONS):
+        LogLevel[LogLevel.INFO : LogLevel.FATAL]
+    elapsed = time.perf_counter() - start
+
+    # ~1-2 µs per slice locally; the bound allows 100 µs per call.
+    assert elapsed < _ITERATIONS * 100e-6
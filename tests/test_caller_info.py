@@ -0,0 +1,43 @@
+"""Tests for opt-in caller capture on Logger."""
+
+import pytest
+
+from multilog import Logger, LogLevel
+
+
+@pytest.fixture
+def caller_logger(recording_sink_cls):
+    """A recording sink paired with a caller-capturing Logger."""
+    sink = recording_sink_cls()
+    return sink, Logger(sinks=[sink], include_caller=True)
+
+
+class TestCallerInfo:
+    def test_disabled_by_default(self, recording_sink_cls):
+        sink = recording_sink_cls()
+        logger = Logger(sinks=[sink])
+
+        logger.log("hello", LogLevel.INFO)
+
+        assert "caller" not in sink.payloads[0]
+
+    def test_caller_points_at_user_code(self, caller_logger):
+        sink, logger = caller_logger
+
+        logger.log("hello", LogLevel.INFO)
+
+        caller = sink.payloads[0]["caller"]
+        assert caller["file"].endswith("test_caller_info.py")
+        assert caller["function"] == "test_caller_points_at_user_code"
+        assert isinstance(caller["line"], int)
+
+    def test_caller_captured_for_log_exception(self, caller_logger):
+        sink, logger = caller_logger
+
+        try:
+            raise ValueError("boom")
+        except ValueError as exc:
+            logger.log_exception("failed", exc)
+
+        caller = sink.payloads[0]["caller"]
+        assert caller["function"] == "test_caller_captured_for_log_exception"
@@ -31,3 +31,14 @@ class TestFileSink:
 
         rows = _read_jsonl(path)
         assert [row["message"] for row in rows] == ["old", "new"]
+
+    def test_default_context_folded_into_written_lines(self, tmp_path):
+        path = tmp_path / "app.jsonl"
+
+        sink = FileSink(path, default_context={"env": "test", "source": "default"})
+        sink.emit({"message": "hello", "level": "info", "source": "override"})
+
+        row = _read_jsonl(path)[0]
+        assert row["env"] == "test"
+        assert row["source"] == "override"
+        assert row["message"] == "hello"
@@ -0,0 +1,26 @@
+"""Tests for lazy sink exports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import multilog
+
+
+class TestLazyBetterstackExport:
+    def test_import_multilog_does_not_import_httpx(self):
+        # Fresh interpreter: this process has already resolved the lazy
+        # export via other tests.
+        code = "import sys, multilog; sys.exit('httpx' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code])
+        assert result.returncode == 0
+
+    def test_lazy_attribute_resolves_to_sink_class(self):
+        from multilog.sinks.betterstack import BetterstackSink
+
+        assert multilog.BetterstackSink is BetterstackSink
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError, match="does_not_exist"):
+            _ = multilog.does_not_exist
@@ -1,19 +1,33 @@
 """Tests for LogLevel enum: slice syntax, comparison operators, and serialization."""
 
 import json
+import operator
 
 import pytest
 
 from multilog.levels import LogLevel
 
-ALL_LEVELS = [
+ALL_LEVELS = (
     LogLevel.TRACE,
     LogLevel.DEBUG,
     LogLevel.INFO,
     LogLevel.WARN,
     LogLevel.ERROR,
     LogLevel.FATAL,
-]
+)
+
+# Expected slice results, derived once from the hand-ordered tuple above
+# so the slice tests share one source of truth for severity order. They
+# are lists because LogLevel slicing returns a list.
+FULL_RANGE = list(ALL_LEVELS)
+TRACE_TO_DEBUG = FULL_RANGE[:2]
+TRACE_TO_INFO = FULL_RANGE[:3]
+TRACE_TO_WARN = FULL_RANGE[:4]
+DEBUG_TO_INFO = FULL_RANGE[1:3]
+DEBUG_TO_ERROR = FULL_RANGE[1:5]
+INFO_TO_FATAL = FULL_RANGE[2:]
+WARN_TO_FATAL = FULL_RANGE[3:]
+ERROR_TO_FATAL = FULL_RANGE[4:]
 
 
 # --- Slice syntax: member endpoints ---
@@ -21,36 +35,22 @@ ALL_LEVELS = [
 
 class TestSliceWithMembers:
     def test_middle_range(self):
-        assert LogLevel[LogLevel.INFO : LogLevel.FATAL] == [
-            LogLevel.INFO,
-            LogLevel.WARN,
-            LogLevel.ERROR,
-            LogLevel.FATAL,
-        ]
+        assert LogLevel[LogLevel.INFO : LogLevel.FATAL] == INFO_TO_FATAL
 
     def test_full_range(self):
-        assert LogLevel[LogLevel.TRACE : LogLevel.FATAL] == ALL_LEVELS
+        assert LogLevel[LogLevel.TRACE : LogLevel.FATAL] == FULL_RANGE
 
     def test_single_element(self):
         assert LogLevel[LogLevel.WARN : LogLevel.WARN] == [LogLevel.WARN]
 
     def test_first_two(self):
-        assert LogLevel[LogLevel.TRACE : LogLevel.DEBUG] == [
-            LogLevel.TRACE,
-            LogLevel.DEBUG,
-        ]
+        assert LogLevel[LogLevel.TRACE : LogLevel.DEBUG] == TRACE_TO_DEBUG
 
     def test_last_two(self):
-        assert LogLevel[LogLevel.ERROR : LogLevel.FATAL] == [
-            LogLevel.ERROR,
-            LogLevel.FATAL,
-        ]
+        assert LogLevel[LogLevel.ERROR : LogLevel.FATAL] == ERROR_TO_FATAL
 
     def test_adjacent_pair(self):
-        assert LogLevel[LogLevel.DEBUG : LogLevel.INFO] == [
-            LogLevel.DEBUG,
-            LogLevel.INFO,
-        ]
+        assert LogLevel[LogLevel.DEBUG : LogLevel.INFO] == DEBUG_TO_INFO
 
 
 # --- Slice syntax: value strings ---
@@ -58,20 +58,10 @@ class TestSliceWithMembers:
 
 class TestSliceWithValueStrings:
     def test_lowercase_values(self):
-        assert LogLevel["info":"fatal"] == [
-            LogLevel.INFO,
-            LogLevel.WARN,
-            LogLevel.ERROR,
-            LogLevel.FATAL,
-        ]
+        assert LogLevel["info":"fatal"] == INFO_TO_FATAL
 
     def test_trace_to_warn(self):
-        assert LogLevel["trace":"warn"] == [
-            LogLevel.TRACE,
-            LogLevel.DEBUG,
-            LogLevel.INFO,
-            LogLevel.WARN,
-        ]
+        assert LogLevel["trace":"warn"] == TRACE_TO_WARN
 
 
 # --- Slice syntax: name strings ---
@@ -79,20 +69,10 @@ class TestSliceWithValueStrings:
 
 class TestSliceWithNameStrings:
     def test_uppercase_names(self):
-        assert LogLevel["INFO":"FATAL"] == [
-            LogLevel.INFO,
-            LogLevel.WARN,
-            LogLevel.ERROR,
-            LogLevel.FATAL,
-        ]
+        assert LogLevel["INFO":"FATAL"] == INFO_TO_FATAL
 
     def test_debug_to_error(self):
-        assert LogLevel["DEBUG":"ERROR"] == [
-            LogLevel.DEBUG,
-            LogLevel.INFO,
-            LogLevel.WARN,
-            LogLevel.ERROR,
-        ]
+        assert LogLevel["DEBUG":"ERROR"] == DEBUG_TO_ERROR
 
 
 # --- Slice syntax: open-ended ranges ---
@@ -100,35 +80,19 @@ class TestSliceWithNameStrings:
 
 class TestOpenEndedSlices:
     def test_open_start(self):
-        assert LogLevel[: LogLevel.INFO] == [
-            LogLevel.TRACE,
-            LogLevel.DEBUG,
-            LogLevel.INFO,
-        ]
+        assert LogLevel[: LogLevel.INFO] == TRACE_TO_INFO
 
     def test_open_end(self):
-        assert LogLevel[LogLevel.WARN :] == [
-            LogLevel.WARN,
-            LogLevel.ERROR,
-            LogLevel.FATAL,
-        ]
+        assert LogLevel[LogLevel.WARN :] == WARN_TO_FATAL
 
     def test_fully_open(self):
-        assert LogLevel[:] == ALL_LEVELS
+        assert LogLevel[:] == FULL_RANGE
 
     def test_open_start_string(self):
-        assert LogLevel[:"warn"] == [
-            LogLevel.TRACE,
-            LogLevel.DEBUG,
-            LogLevel.INFO,
-            LogLevel.WARN,
-        ]
+        assert LogLevel[:"warn"] == TRACE_TO_WARN
 
     def test_open_end_string(self):
-        assert LogLevel["error":] == [
-            LogLevel.ERROR,
-            LogLevel.FATAL,
-        ]
+        assert LogLevel["error":] == ERROR_TO_FATAL
 
 
 # --- Slice syntax: edge cases ---
@@ -142,16 +106,16 @@ class TestSliceEdgeCases:
         assert LogLevel[LogLevel.INFO : LogLevel.DEBUG] == []
 
     def test_invalid_start_raises(self):
-        with pytest.raises((ValueError, KeyError)):
+        with pytest.raises(KeyError, match="bogus"):
             LogLevel["bogus" : LogLevel.FATAL]
 
     def test_invalid_stop_raises(self):
-        with pytest.raises((ValueError, KeyError)):
+        with pytest.raises(KeyError, match="bogus"):
             LogLevel[LogLevel.TRACE : "bogus"]
 
-    def test_each_single_level_slice(self):
-        for level in ALL_LEVELS:
-            assert LogLevel[level:level] == [level]
+    @pytest.mark.parametrize("level", ALL_LEVELS, ids=lambda level: level.name)
+    def test_each_single_level_slice(self, level):
+        assert LogLevel[level:level] == [level]
 
 
 # --- Name access (standard enum behavior) ---
@@ -190,41 +154,26 @@ class TestValueConstruction:
 
 
 class TestComparisons:
-    def test_ge_higher(self):
-        assert LogLevel.FATAL >= LogLevel.TRACE
-
-    def test_ge_equal(self):
-        assert LogLevel.INFO >= LogLevel.INFO
-
-    def test_ge_lower_is_false(self):
-        assert not (LogLevel.DEBUG >= LogLevel.ERROR)
-
-    def test_gt_higher(self):
-        assert LogLevel.ERROR > LogLevel.WARN
-
-    def test_gt_equal_is_false(self):
-        assert not (LogLevel.INFO > LogLevel.INFO)
-
-    def test_gt_lower_is_false(self):
-        assert not (LogLevel.TRACE > LogLevel.DEBUG)
-
-    def test_le_lower(self):
-        assert LogLevel.TRACE <= LogLevel.FATAL
-
-    def test_le_equal(self):
-        assert LogLevel.WARN <= LogLevel.WARN
-
-    def test_le_higher_is_false(self):
-        assert not (LogLevel.FATAL <= LogLevel.ERROR)
-
-    def test_lt_lower(self):
-        assert LogLevel.DEBUG < LogLevel.INFO
-
-    def test_lt_equal_is_false(self):
-        assert not (LogLevel.WARN < LogLevel.WARN)
-
-    def test_lt_higher_is_false(self):
-        assert not (LogLevel.ERROR < LogLevel.DEBUG)
+    @pytest.mark.parametrize(
+        ("a", "op", "b", "expected"),
+        [
+            (LogLevel.FATAL, operator.ge, LogLevel.TRACE, True),
+            (LogLevel.INFO, operator.ge, LogLevel.INFO, True),
+            (LogLevel.DEBUG, operator.ge, LogLevel.ERROR, False),
+            (LogLevel.ERROR, operator.gt, LogLevel.WARN, True),
+            (LogLevel.INFO, operator.gt, LogLevel.INFO, False),
+            (LogLevel.TRACE, operator.gt, LogLevel.DEBUG, False),
+            (LogLevel.TRACE, operator.le, LogLevel.FATAL, True),
+            (LogLevel.WARN, operator.le, LogLevel.WARN, True),
+            (LogLevel.FATAL, operator.le, LogLevel.ERROR, False),
+            (LogLevel.DEBUG, operator.lt, LogLevel.INFO, True),
+            (LogLevel.WARN, operator.lt, LogLevel.WARN, False),
+            (LogLevel.ERROR, operator.lt, LogLevel.DEBUG, False),
+        ],
+        ids=lambda arg: arg.__name__ if callable(arg) else str(arg),
+    )
+    def test_operator_truth_table(self, a, op, b, expected):
+        assert op(a, b) is expected
 
     def test_not_implemented_for_other_types(self):
         assert LogLevel.INFO.__ge__(42) is NotImplemented
@@ -236,31 +185,38 @@ class TestComparisons:
 class TestComparisonOrdering:
     """Verify the full severity ordering is correct."""
 
-    def test_strict_ascending_order(self):
-        for i in range(len(ALL_LEVELS) - 1):
-            lower = ALL_LEVELS[i]
-            higher = ALL_LEVELS[i + 1]
-            assert lower < higher, f"{lower} should be < {higher}"
-            assert higher > lower, f"{higher} should be > {lower}"
-
-    def test_all_pairs(self):
-        for i, a in enumerate(ALL_LEVELS):
-            for j, b in enumerate(ALL_LEVELS):
-                if i < j:
-                    assert a < b
-                    assert a <= b
-                    assert b > a
-                    assert b >= a
-                elif i == j:
-                    assert a <= b
-                    assert a >= b
-                    assert not (a < b)
-                    assert not (a > b)
-                else:
-                    assert a > b
-                    assert a >= b
-                    assert b < a
-                    assert b <= a
+    @pytest.mark.parametrize(
+        ("lower", "higher"),
+        list(zip(ALL_LEVELS, ALL_LEVELS[1:], strict=False)),
+        ids=lambda level: level.name,
+    )
+    def test_strict_ascending_order(self, lower, higher):
+        assert lower < higher
+        assert higher > lower
+
+    @pytest.mark.parametrize(
+        "a,b",
+        [(a, b) for a in ALL_LEVELS for b in ALL_LEVELS],
+        ids=lambda level: level.name,
+    )
+    def test_all_pairs(self, a, b):
+        i = ALL_LEVELS.index(a)
+        j = ALL_LEVELS.index(b)
+        if i < j:
+            assert a < b
+            assert a <= b
+            assert b > a
+            assert b >= a
+        elif i == j:
+            assert a <= b
+            assert a >= b
+            assert not (a < b)
+            assert not (a > b)
+        else:
+            assert a > b
+            assert a >= b
+            assert b < a
+            assert b <= a
 
 
 # --- Equality and identity ---
@@ -293,7 +249,7 @@ class TestSerialization:
         assert json.dumps({"level": LogLevel.INFO}) == '{"level": "info"}'
 
     def test_json_all_levels(self):
-        data = json.dumps(list(ALL_LEVELS))
+        data = json.dumps(FULL_RANGE)
         assert data == '["trace", "debug", "info", "warn", "error", "fatal"]'
 
     def test_json_roundtrip(self):
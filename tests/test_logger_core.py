@@ -0,0 +1,33 @@
+"""Tests for _LoggerCore log dispatch and level filtering."""
+
+from multilog._core import _LoggerCore
+from multilog.levels import LogLevel
+
+
+class TestLevelFiltering:
+    def test_accepted_level_is_emitted(self, recording_sink_cls):
+        sink = recording_sink_cls(included_levels=LogLevel[LogLevel.INFO :])
+        core = _LoggerCore(sinks=[sink])
+
+        core.log("hello", LogLevel.INFO)
+
+        assert [p["message"] for p in sink.payloads] == ["hello"]
+
+    def test_filtered_level_is_dropped(self, recording_sink_cls):
+        sink = recording_sink_cls(included_levels=LogLevel[LogLevel.INFO :])
+        core = _LoggerCore(sinks=[sink])
+
+        core.log("hello", LogLevel.DEBUG)
+
+        assert sink.payloads == []
+
+    def test_mixed_sinks_emit_only_where_accepted(self, recording_sink_cls):
+        verbose = recording_sink_cls()
+        errors_only = recording_sink_cls(included_levels=[LogLevel.ERROR, LogLevel.FATAL])
+        core = _LoggerCore(sinks=[verbose, errors_only])
+
+        core.log("info msg", LogLevel.INFO)
+        core.log("error msg", LogLevel.ERROR)
+
+        assert [p["message"] for p in verbose.payloads] == ["info msg", "error msg"]
+        assert [p["message"] for p in errors_only.payloads] == ["error msg"]